@@ -0,0 +1,29 @@
+"""
+Rainbow LUT - Shared rainbow colormap sampled into a uint8 lookup table
+"""
+
+import numpy as np
+
+
+# Rainbow anchor colors and their normalized positions
+_COLORS = np.array([
+    (1, 0, 0),     # red
+    (1, 0.5, 0),   # orange
+    (1, 1, 0),     # yellow
+    (0, 1, 0),     # green
+    (0, 1, 1),     # cyan
+    (0, 0, 1),     # blue
+    (1, 0, 1)      # magenta
+], dtype=np.float32)
+_POSITIONS = [0, 0.15, 0.3, 0.45, 0.6, 0.75, 1.0]
+
+
+def _build_rainbow_lut(size=256):
+    """Linearly interpolate the anchor colors into a (size, 3) uint8 table"""
+    samples = np.linspace(0, 1, size, dtype=np.float32)
+    channels = [np.interp(samples, _POSITIONS, _COLORS[:, c]) for c in range(3)]
+    return (np.stack(channels, axis=1) * 255).astype(np.uint8)
+
+
+# Built once at import and shared by every gradient effect
+RAINBOW_LUT = _build_rainbow_lut()
@@ -14,14 +14,29 @@ class BaseColorEffect(EffectRenderer):
         super().__init__(screen_size)
         self.base_color = (50, 50, 100)  # Default blue-gray
         
+        # Cache of the last audio-reactive color, keyed by quantized volume
+        self._base_arr = np.array(self.base_color, dtype=np.int16)
+        self._volume_buckets = 64
+        self._silence_threshold = 0.01  # Volumes at or below this use the base color
+        self._last_bucket = -1
+        self._last_color = self.base_color
+        
     def render(self, surface, time_elapsed, audio_data=None):
         """Render a solid color background"""
-        # Fill with base color
-        surface.fill(self.base_color)
+        # Quantize volume so the reactive color is only recomputed on real changes;
+        # silent frames fall straight through to the base color
+        volume = getattr(audio_data, 'volume', 0) if audio_data else 0
+        if volume > self._silence_threshold:
+            bucket = int(volume * self._volume_buckets)
+        else:
+            bucket = 0
         
-        # Optionally add subtle audio reactivity
-        if audio_data and hasattr(audio_data, 'volume'):
+        if bucket != self._last_bucket:
             # Slightly brighten based on volume
-            brightness_factor = 1.0 + (audio_data.volume * 0.3)
-            reactive_color = tuple(int(c * brightness_factor) for c in self.base_color)
-            surface.fill(reactive_color) 
\ No newline at end of file
+            brightness_factor = 1.0 + (bucket / self._volume_buckets) * 0.3
+            reactive = np.minimum(self._base_arr * brightness_factor, 255)
+            self._last_color = tuple(reactive.astype(np.uint8).tolist())
+            self._last_bucket = bucket
+        
+        # Single fill per frame
+        surface.fill(self._last_color)
@@ -2,38 +2,49 @@
 Colors Registry - Manages all available color effects
 """
 
-from .base_color_effect import BaseColorEffect
-from .radial_gradient_effect import RadialGradientEffect
-from .horizontal_rainbow_effect import HorizontalRainbowEffect
-from .red_color_effect import RedColorEffect
-from .blue_color_effect import BlueColorEffect
-from .green_color_effect import GreenColorEffect
-from .yellow_color_effect import YellowColorEffect
-from .purple_color_effect import PurpleColorEffect
+import importlib
 
 
 class ColorsRegistry:
     """Registry for all available color effects"""
     
     def __init__(self):
+        # Built-in effects are named as "module:ClassName" (optionally with extra
+        # constructor args) and only imported the first time they are requested
         self.colors = {
-            "Base Color": BaseColorEffect,
-            "Red": RedColorEffect,
-            "Blue": BlueColorEffect,
-            "Green": GreenColorEffect,
-            "Yellow": YellowColorEffect,
-            "Purple": PurpleColorEffect,
-            "Radial Gradient": RadialGradientEffect,
-            "Horizontal Rainbow": HorizontalRainbowEffect,
+            "Base Color": "base_color_effect:BaseColorEffect",
+            "Red": ("solid_color_effect:SolidColorEffect", (255, 0, 0)),
+            "Blue": ("solid_color_effect:SolidColorEffect", (0, 0, 255)),
+            "Green": ("solid_color_effect:SolidColorEffect", (0, 255, 0)),
+            "Yellow": ("solid_color_effect:SolidColorEffect", (255, 255, 0)),
+            "Purple": ("solid_color_effect:SolidColorEffect", (128, 0, 128)),
+            "Radial Gradient": "radial_gradient_effect:RadialGradientEffect",
+            "Horizontal Rainbow": "horizontal_rainbow_effect:HorizontalRainbowEffect",
         }
+        # Instances keyed by (name, screen_size) so cached surfaces survive mode switches
+        self._instances = {}
+    
+    def _create(self, spec, screen_size):
+        """Build an effect from a registry entry, importing its module if needed"""
+        args = ()
+        if isinstance(spec, tuple):
+            spec, *args = spec
+        if isinstance(spec, str):
+            module_name, class_name = spec.split(":")
+            module = importlib.import_module("." + module_name, package=__package__)
+            spec = getattr(module, class_name)
+        return spec(screen_size, *args)
     
     def get_color(self, color_name, screen_size):
         """Get a color effect instance by name"""
-        if color_name in self.colors:
-            return self.colors[color_name](screen_size)
-        else:
+        if color_name not in self.colors:
             # Fallback to base color
-            return self.colors["Base Color"](screen_size)
+            color_name = "Base Color"
+        
+        key = (color_name, tuple(screen_size))
+        if key not in self._instances:
+            self._instances[key] = self._create(self.colors[color_name], screen_size)
+        return self._instances[key]
     
     def get_available_colors(self):
         """Get list of available color names"""
@@ -42,7 +53,9 @@ class ColorsRegistry:
     def register_color(self, name, color_class):
         """Register a new color effect"""
         self.colors[name] = color_class
+        # Drop any instances built from a previous registration under this name
+        self._instances = {key: effect for key, effect in self._instances.items() if key[0] != name}
 
 
 # Global registry instance
-colors_registry = ColorsRegistry() 
\ No newline at end of file
+colors_registry = ColorsRegistry()
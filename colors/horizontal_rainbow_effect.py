@@ -4,8 +4,8 @@ Horizontal Rainbow Effect - Horizontal rainbow gradient across the screen
 
 import pygame
 import numpy as np
-from matplotlib.colors import LinearSegmentedColormap
 from effects.base_effect import EffectRenderer
+from ._rainbow_lut import RAINBOW_LUT
 
 
 class HorizontalRainbowEffect(EffectRenderer):
@@ -15,45 +15,35 @@ class HorizontalRainbowEffect(EffectRenderer):
         super().__init__(screen_size)
         self.cached_surface = None
         self.cached_size = None
-        
-        # Define rainbow colors for horizontal gradient
-        colors = [
-            (1, 0, 0),     # red
-            (1, 0.5, 0),   # orange
-            (1, 1, 0),     # yellow
-            (0, 1, 0),     # green
-            (0, 1, 1),     # cyan
-            (0, 0, 1),     # blue
-            (1, 0, 1)      # magenta
-        ]
-        positions = [0, 0.15, 0.3, 0.45, 0.6, 0.75, 1.0]  # Normalized horizontal positions
-        
-        # Create custom horizontal rainbow colormap
-        self.cmap = LinearSegmentedColormap.from_list("horizontal_rainbow", list(zip(positions, colors)))
+        self.lut = RAINBOW_LUT
     
-    def generate_horizontal_rainbow(self, width, height):
+    def generate_horizontal_rainbow(self, width, height, out=None):
         """
         Generates a horizontal rainbow gradient.
 
         Args:
             width (int): Width of the image.
             height (int): Height of the image.
+            out (np.ndarray): Optional (width, height, 3) uint8 array to write into,
+                e.g. a surfarray.pixels3d view of the target surface.
 
         Returns:
-            np.ndarray: RGB image array of the gradient.
+            np.ndarray: uint8 RGB image array of shape (width, height, 3).
         """
-        # Create horizontal coordinate grid (0 to 1)
-        x = np.linspace(0, 1, width)
-        y = np.linspace(0, 1, height)
-        xx, yy = np.meshgrid(x, y)
-
-        # Use x-coordinate for the gradient (horizontal)
-        gradient_x = xx
-
-        # Apply colormap to get RGB values
-        gradient_rgb = self.cmap(gradient_x)
+        # Colors run left (red) to right (magenta); every row is identical,
+        # so look up a single (width, 3) strip
+        x = np.linspace(0, 1, width, dtype=np.float32)
+        row = self.lut[np.clip(x * 255, 0, 255).astype(np.uint8)]
         
-        return gradient_rgb
+        # Stretch the strip down the columns
+        if out is None:
+            return np.broadcast_to(row[:, None, :], (width, height, 3))
+        out[:] = row[:, None, :]
+        return out
+
+    def is_static(self):
+        """The gradient never changes between frames"""
+        return True
 
     def render(self, surface, time_elapsed, audio_data=None):
         """Render a static horizontal rainbow gradient"""
@@ -63,15 +53,19 @@ class HorizontalRainbowEffect(EffectRenderer):
         
         # Check if we need to regenerate the cached surface
         if self.cached_surface is None or self.cached_size != current_size:
-            # Generate the horizontal rainbow gradient
-            gradient_rgb = self.generate_horizontal_rainbow(surface_height, surface_width)
-            
-            # Convert to pygame surface format (0-255, integer)
-            gradient_rgb_255 = (gradient_rgb[:, :, :3] * 255).astype(np.uint8) 
-            
-            # Create pygame surface from numpy array
-            self.cached_surface = pygame.surfarray.make_surface(gradient_rgb_255)
+            # Allocate the cached surface in the destination pixel format so
+            # each blit is a straight copy
+            self.cached_surface = pygame.Surface(current_size)
+            try:
+                self.cached_surface = self.cached_surface.convert(surface)
+            except pygame.error:
+                pass
             self.cached_size = current_size
+            
+            # Generate the gradient straight into the surface's pixel memory
+            pixels = pygame.surfarray.pixels3d(self.cached_surface)
+            self.generate_horizontal_rainbow(surface_width, surface_height, out=pixels)
+            del pixels  # Release the surface lock before blitting
         
         # Blit the cached gradient onto the main surface
         surface.blit(self.cached_surface, (0, 0)) 
\ No newline at end of file
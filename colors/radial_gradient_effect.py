@@ -1,38 +1,63 @@
 """
-Radial Gradient Effect - Smooth radial gradient using matplotlib colormap
+Radial Gradient Effect - Smooth radial gradient using a rainbow colormap
 """
 
 import pygame
 import numpy as np
-from matplotlib.colors import LinearSegmentedColormap
+from numba import njit, prange
 from effects.base_effect import EffectRenderer
+from ._rainbow_lut import RAINBOW_LUT
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _radial_rgb(out, lut_r2, width, height, zoom):
+    """Fill out[x, y] with the color for each pixel's squared radius in one pass"""
+    min_dim = min(width, height)
+    last = lut_r2.shape[0] - 1
+    
+    # linspace(-1, 1, n) step, pre-scaled so the gradient stays circular
+    # float32 scalars let the inner loop vectorize with twice the lanes
+    one = np.float32(1.0)
+    step_x = np.float32(2.0 / (width - 1) if width > 1 else 0.0)
+    step_y = np.float32(2.0 / (height - 1) if height > 1 else 0.0)
+    s_x = np.float32(width / min_dim)
+    s_y = np.float32(height / min_dim)
+    zoom_sq = np.float32(zoom * zoom)
+    scale = np.float32(last)
+    
+    # out is usually a surfarray.pixels3d view, where x is the contiguous axis
+    # and y steps by the row pitch, so threads split rows and walk along x
+    for y in prange(height):
+        dy = (np.float32(y) * step_y - one) * s_y
+        for x in range(width):
+            dx = (np.float32(x) * step_x - one) * s_x
+            r2 = (dx * dx + dy * dy) * zoom_sq
+            if r2 > one:
+                r2 = one
+            idx = int(r2 * scale)
+            out[x, y, 0] = lut_r2[idx, 0]
+            out[x, y, 1] = lut_r2[idx, 1]
+            out[x, y, 2] = lut_r2[idx, 2]
+
+
+def _squared_radius_lut(lut, size=4096):
+    """Re-index a radius LUT by squared radius so the kernel can skip the sqrt"""
+    radius = np.sqrt(np.linspace(0, 1, size, dtype=np.float32))
+    return lut[np.clip(radius * 255, 0, 255).astype(np.uint8)]
 
 
 class RadialGradientEffect(EffectRenderer):
-    """Smooth radial gradient effect using matplotlib colormap"""
+    """Smooth radial gradient effect using a rainbow colormap"""
     
     def __init__(self, screen_size):
         super().__init__(screen_size)
         self.max_radius = min(self.width, self.height) // 2
         self.cached_surface = None
         self.cached_size = None
-        
-        # Define custom colormap for smooth radial gradient
-        colors = [
-            (1, 0, 0),     # red
-            (1, 0.5, 0),   # orange
-            (1, 1, 0),     # yellow
-            (0, 1, 0),     # green
-            (0, 1, 1),     # cyan
-            (0, 0, 1),     # blue
-            (1, 0, 1)      # magenta
-        ]
-        positions = [0, 0.15, 0.3, 0.45, 0.6, 0.75, 1.0]  # Normalized radial positions
-        
-        # Create custom radial gradient colormap
-        self.cmap = LinearSegmentedColormap.from_list("radial_gradient", list(zip(positions, colors)))
+        self.lut = RAINBOW_LUT
+        self.lut_r2 = _squared_radius_lut(self.lut)
     
-    def generate_radial_gradient_circular(self, height, width, zoom_factor=1):
+    def generate_radial_gradient_circular(self, height, width, zoom_factor=1, out=None):
         """
         Generates a smooth radial (circular) gradient that fits within the smallest dimension.
         The outermost ring fills the remaining space.
@@ -41,47 +66,45 @@ class RadialGradientEffect(EffectRenderer):
             width (int): Width of the image.
             height (int): Height of the image.
             zoom_factor (float): Zoom factor for the gradient (higher = more zoomed in).
+            out (np.ndarray): Optional (width, height, 3) uint8 array to write into,
+                e.g. a surfarray.pixels3d view of the target surface.
 
         Returns:
-            np.ndarray: RGB image array of the gradient.
+            np.ndarray: uint8 RGB image array of the gradient.
         """
-        # Create coordinate grid centered at (0,0)
-        x = np.linspace(-1, 1, height)
-        y = np.linspace(-1, 1, width)
-        xx, yy = np.meshgrid(x, y)
-
-        # Normalize radius using the smaller dimension to keep it circular
-        min_dim = min(height, width)
-        norm_xx = xx * (height / min_dim)
-        norm_yy = yy * (width / min_dim)
-        radius = np.sqrt(norm_xx**2 + norm_yy**2)
+        if out is None:
+            out = np.empty((width, height, 3), dtype=np.uint8)
         
-        # Apply zoom factor
-        radius = radius * zoom_factor
-        radius = np.clip(radius, 0, 1)
-
-        # Apply colormap to get RGB values
-        gradient_rgb = self.cmap(radius)
+        # Single fused, multithreaded pass writing uint8 RGB in surfarray (W, H) order
+        _radial_rgb(out, self.lut_r2, width, height, zoom_factor)
         
-        return gradient_rgb
+        return out
+
+    def is_static(self):
+        """The gradient never changes between frames"""
+        return True
 
     def render(self, surface, time_elapsed, audio_data=None):
-        """Render a static smooth radial gradient using matplotlib colormap"""
+        """Render a static smooth radial gradient using a rainbow colormap"""
         # Get actual surface dimensions
         surface_width, surface_height = surface.get_size()
         current_size = (surface_width, surface_height)
         
         # Check if we need to regenerate the cached surface
         if self.cached_surface is None or self.cached_size != current_size:
-            # Generate the circular gradient (static)
-            gradient_rgb = self.generate_radial_gradient_circular(surface_height, surface_width, .65)
-            
-            # Convert to pygame surface format (0-255, integer)
-            gradient_rgb_255 = (gradient_rgb[:, :, :3] * 255).astype(np.uint8) 
-            
-            # Create pygame surface from numpy array
-            self.cached_surface = pygame.surfarray.make_surface(gradient_rgb_255)
+            # Allocate the cached surface in the destination pixel format so
+            # each blit is a straight copy
+            self.cached_surface = pygame.Surface(current_size)
+            try:
+                self.cached_surface = self.cached_surface.convert(surface)
+            except pygame.error:
+                pass
             self.cached_size = current_size
+            
+            # Generate the gradient straight into the surface's pixel memory
+            pixels = pygame.surfarray.pixels3d(self.cached_surface)
+            self.generate_radial_gradient_circular(surface_height, surface_width, .65, out=pixels)
+            del pixels  # Release the surface lock before blitting
         
         # Blit the cached gradient onto the main surface
         surface.blit(self.cached_surface, (0, 0)) 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Solid Color Effect - Solid single-color background
+"""
+
+import pygame
+from effects.base_effect import EffectRenderer
+
+
+class SolidColorEffect(EffectRenderer):
+    """Solid color background effect"""
+    
+    def __init__(self, screen_size, color):
+        super().__init__(screen_size)
+        self.color = color
+        self._cached = None
+        self._cached_size = None
+        
+    def is_static(self):
+        """A solid color never changes between frames"""
+        return True
+        
+    def render(self, surface, time_elapsed, audio_data=None):
+        """Render a solid color background"""
+        # Pre-fill a screen-sized surface once and blit it every frame
+        current_size = surface.get_size()
+        if self._cached is None or self._cached_size != current_size:
+            self._cached = pygame.Surface(current_size)
+            self._cached.fill(self.color)
+            self._cached_size = current_size
+        
+        surface.blit(self._cached, (0, 0))
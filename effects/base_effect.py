@@ -6,6 +6,33 @@ All effects should inherit from this class
 import pygame
 import math
 import time
+import numpy as np
+
+
+def _build_hue_lut():
+    """Precompute RGB colors for each whole degree of hue (simple HSV to RGB)"""
+    lut = np.empty((360, 3), dtype=np.uint8)
+    for hue in range(360):
+        h = hue / 60.0
+        i = int(h)
+        f = h - i
+        if i == 0:
+            lut[hue] = (255, int(255 * f), 0)
+        elif i == 1:
+            lut[hue] = (int(255 * (1 - f)), 255, 0)
+        elif i == 2:
+            lut[hue] = (0, 255, int(255 * f))
+        elif i == 3:
+            lut[hue] = (0, int(255 * (1 - f)), 255)
+        elif i == 4:
+            lut[hue] = (int(255 * f), 0, 255)
+        else:
+            lut[hue] = (255, 0, int(255 * (1 - f)))
+    return lut
+
+
+# Shared by every effect instance; built once at import
+_HUE_LUT = _build_hue_lut()
 
 
 class EffectRenderer:
@@ -17,6 +44,26 @@ class EffectRenderer:
         self.center_x = self.width // 2
         self.center_y = self.height // 2
         self.time_elapsed = 0
+        self._hue_lut = _HUE_LUT
+        
+    def is_static(self):
+        """
+        Return True if this effect draws identical pixels every frame.
+        
+        The renderer may skip calling render() for static effects, or
+        re-render them only inside the regions an overlay changed.
+        """
+        return False
+        
+    def dirty_rects(self, time_elapsed):
+        """
+        Return the screen regions the next render at time_elapsed will
+        change compared to the previous frame.
+        
+        Returns:
+            list of pygame.Rect, or None if the whole screen may change
+        """
+        return None
         
     def render(self, surface, time_elapsed, audio_data=None):
         """
@@ -25,7 +72,7 @@ class EffectRenderer:
         Args:
             surface: pygame surface to draw on
             time_elapsed: time since start in seconds
-            audio_data: AudioProcessor object with volume, beat_detected, frequencies, bpm, bpm_confidence
+            audio_data: AudioSnapshot with volume, beat_detected, frequencies, bpm, bpm_confidence
         """
         # Default effect: transparent overlay with audio-reactive circle
         # Note: This effect should be rendered on top of a color background
@@ -42,22 +89,7 @@ class EffectRenderer:
             elif audio_data.bpm_confidence > 0.5:
                 # Use BPM-based color cycling
                 hue = (time_elapsed * audio_data.bpm / 60.0) % 360
-                # Simple HSV to RGB conversion
-                h = hue / 60.0
-                i = int(h)
-                f = h - i
-                if i == 0:
-                    color = (255, int(255 * f), 0)
-                elif i == 1:
-                    color = (int(255 * (1 - f)), 255, 0)
-                elif i == 2:
-                    color = (0, 255, int(255 * f))
-                elif i == 3:
-                    color = (0, int(255 * (1 - f)), 255)
-                elif i == 4:
-                    color = (int(255 * f), 0, 255)
-                else:
-                    color = (255, 0, int(255 * (1 - f)))
+                color = tuple(self._hue_lut[int(hue) % 360].tolist())
             else:
                 color = (100, 100, 100)  # Gray when no clear rhythm
             
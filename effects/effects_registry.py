@@ -16,14 +16,19 @@ class EffectsRegistry:
             "Pulse": PulseEffect,
             "Spinning Square": SpinningSquareEffect,
         }
+        # Instances keyed by (name, screen_size) so precomputed state survives restarts
+        self._instances = {}
     
     def get_effect(self, effect_name, screen_size):
         """Get an effect instance by name"""
-        if effect_name in self.effects:
-            return self.effects[effect_name](screen_size)
-        else:
+        if effect_name not in self.effects:
             # Fallback to default effect
-            return self.effects["Default"](screen_size)
+            effect_name = "Default"
+        
+        key = (effect_name, tuple(screen_size))
+        if key not in self._instances:
+            self._instances[key] = self.effects[effect_name](screen_size)
+        return self._instances[key]
     
     def get_available_effects(self):
         """Get list of available effect names"""
@@ -32,6 +37,8 @@ class EffectsRegistry:
     def register_effect(self, name, effect_class):
         """Register a new effect"""
         self.effects[name] = effect_class
+        # Drop any instances built from a previous registration under this name
+        self._instances = {key: effect for key, effect in self._instances.items() if key[0] != name}
 
 
 # Global registry instance
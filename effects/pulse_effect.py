@@ -7,6 +7,30 @@ import math
 from effects.base_effect import EffectRenderer
 
 
+def _annulus_rects(center_x, center_y, inner_radius, outer_radius, band_height=16):
+    """Cover an annulus with horizontal bands of rects hugging the ring"""
+    rects = []
+    inner_sq = inner_radius * inner_radius
+    outer_sq = outer_radius * outer_radius
+    
+    for y0 in range(-outer_radius, outer_radius, band_height):
+        y1 = min(y0 + band_height, outer_radius)
+        near = 0 if y0 <= 0 <= y1 else min(abs(y0), abs(y1))
+        far = max(abs(y0), abs(y1))
+        
+        # Widest extent of the outer circle and narrowest of the inner one in this band
+        outer_half = math.ceil(math.sqrt(max(0, outer_sq - near * near)))
+        inner_half = int(math.sqrt(inner_sq - far * far)) if far < inner_radius else 0
+        
+        top = center_y + y0
+        if inner_half > 0:
+            rects.append(pygame.Rect(center_x - outer_half, top, outer_half - inner_half, y1 - y0))
+            rects.append(pygame.Rect(center_x + inner_half, top, outer_half - inner_half, y1 - y0))
+        else:
+            rects.append(pygame.Rect(center_x - outer_half, top, 2 * outer_half, y1 - y0))
+    return rects
+
+
 class PulseEffect(EffectRenderer):
     """Growing circle outline effect that expands from center"""
     
@@ -17,22 +41,56 @@ class PulseEffect(EffectRenderer):
         self.max_radius = math.sqrt(self.width**1.82 + self.height**1.82)  # Diagonal distance to ensure it goes out of frame
         self.line_thickness = 3
         
+        # Mask surface is allocated once; only the previous ring is cleared each frame
+        self.mask_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.mask_surface.fill((0, 0, 0, 255))
+        self.mask_radius = None
+        
+    def _ring_rects(self, low, high):
+        """Return on-screen rects covering rings with radii between low and high"""
+        screen_rect = pygame.Rect(0, 0, self.width, self.height)
+        inner = max(0, int(low) - self.line_thickness - 1)
+        outer = int(high) + 2
+        rects = []
+        for rect in _annulus_rects(self.center_x, self.center_y, inner, outer):
+            rect = rect.clip(screen_rect)
+            if rect.width and rect.height:
+                rects.append(rect)
+        return rects
+        
+    def dirty_rects(self, time_elapsed):
+        """Return the annulus swept between the previous and next ring"""
+        prev_radius = self.pulse_radius
+        next_radius = (time_elapsed * self.pulse_speed) % self.max_radius
+        
+        if next_radius >= prev_radius:
+            spans = [(prev_radius, next_radius)]
+        else:
+            # The pulse wrapped around; clear the old ring and draw the new one
+            spans = [(prev_radius, prev_radius), (next_radius, next_radius)]
+        
+        rects = []
+        for low, high in spans:
+            rects.extend(self._ring_rects(low, high))
+        return rects
+        
     def render(self, surface, time_elapsed, audio_data=None):
         """Render a growing circle outline cutout"""
         # Calculate current pulse radius based on time
         self.pulse_radius = (time_elapsed * self.pulse_speed) % self.max_radius
         
-        # Create a temporary surface for the mask
-        temp_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
-        # Fill everything with black
-        temp_surface.fill((0, 0, 0, 255))
+        # Restore the previous ring to opaque black
+        if self.mask_radius is not None:
+            for rect in self._ring_rects(self.mask_radius, self.mask_radius):
+                self.mask_surface.fill((0, 0, 0, 255), rect)
+            self.mask_radius = None
         
         # Draw the circle outline as transparent (cutout)
         if self.pulse_radius > 0:
             # Draw transparent circle outline
-            pygame.draw.circle(temp_surface, (0, 0, 0, 0), (self.center_x, self.center_y), 
+            pygame.draw.circle(self.mask_surface, (0, 0, 0, 0), (self.center_x, self.center_y), 
                              int(self.pulse_radius), self.line_thickness)
+            self.mask_radius = self.pulse_radius
         
         # Blit the mask onto the main surface
-        surface.blit(temp_surface, (0, 0)) 
\ No newline at end of file
+        surface.blit(self.mask_surface, (0, 0))
\ No newline at end of file
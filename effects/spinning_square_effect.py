@@ -4,6 +4,7 @@ Spinning Square Effect - Rotating square outline
 
 import pygame
 import math
+import numpy as np
 from effects.base_effect import EffectRenderer
 
 
@@ -16,6 +17,35 @@ class SpinningSquareEffect(EffectRenderer):
         self.square_size = 750
         self.line_thickness = 3
         
+        # Pre-rotated corner offsets at 0.1 degree steps
+        self._rot_steps = 3600
+        self._rot_lut = self._build_rotation_lut()
+        
+    def _build_rotation_lut(self):
+        """Rotate the square's corners around the origin for every step of rotation"""
+        half_size = self.square_size // 2
+        square_points = np.array([
+            (-half_size, -half_size),  # top-left
+            (half_size, -half_size),   # top-right
+            (half_size, half_size),    # bottom-right
+            (-half_size, half_size)    # bottom-left
+        ], dtype=np.float32)
+        
+        angles = np.radians(np.arange(self._rot_steps) * (360.0 / self._rot_steps))
+        cos_a = np.cos(angles).astype(np.float32)[:, None]
+        sin_a = np.sin(angles).astype(np.float32)[:, None]
+        
+        lut = np.empty((self._rot_steps, 4, 2), dtype=np.float32)
+        lut[:, :, 0] = square_points[:, 0] * cos_a - square_points[:, 1] * sin_a
+        lut[:, :, 1] = square_points[:, 0] * sin_a + square_points[:, 1] * cos_a
+        return lut
+        
+    def dirty_rects(self, time_elapsed):
+        """Return the bounding box of the square at any rotation"""
+        extent = int(self.square_size / math.sqrt(2)) + self.line_thickness + 1
+        rect = pygame.Rect(self.center_x - extent, self.center_y - extent, 2 * extent, 2 * extent)
+        return [rect.clip(pygame.Rect(0, 0, self.width, self.height))]
+        
     def render(self, surface, time_elapsed, audio_data=None):
         """Render a spinning square outline"""
         # Calculate current rotation angle
@@ -27,26 +57,9 @@ class SpinningSquareEffect(EffectRenderer):
         # Fill everything with black
         temp_surface.fill((0, 0, 0, 255))
         
-        # Calculate square corners
-        half_size = self.square_size // 2
-        square_points = [
-            (-half_size, -half_size),  # top-left
-            (half_size, -half_size),   # top-right
-            (half_size, half_size),    # bottom-right
-            (-half_size, half_size)    # bottom-left
-        ]
-        
-        # Rotate the square points
-        rotated_points = []
-        for point in square_points:
-            x, y = point
-            # Rotate around origin
-            cos_a = math.cos(math.radians(rotation_angle))
-            sin_a = math.sin(math.radians(rotation_angle))
-            rotated_x = x * cos_a - y * sin_a
-            rotated_y = x * sin_a + y * cos_a
-            # Translate to center of screen
-            rotated_points.append((rotated_x + self.center_x, rotated_y + self.center_y))
+        # Look up the pre-rotated corners and translate to center of screen
+        step = int(rotation_angle * self._rot_steps / 360) % self._rot_steps
+        rotated_points = (self._rot_lut[step] + (self.center_x, self.center_y)).tolist()
         
         # Draw the square outline as transparent (cutout)
         if len(rotated_points) >= 4:
@@ -6,21 +6,95 @@ A minimal foundation for building your own projector laser effects
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pygame
-import numpy as np
 import threading
+import queue
 import time
 import math
 import random
-import pyaudio
-from scipy.fft import fft
 import sys
 import os
 import json
+import functools
+import importlib.util
+import collections
+from dataclasses import dataclass
+
+def _check_dependencies():
+    """Exit with an install hint if a third-party module is missing"""
+    required_modules = ['pygame', 'numpy', 'pyaudio', 'scipy', 'librosa', 'numba']
+    # find_spec only locates each module, it does not import it
+    missing_modules = [module for module in required_modules if importlib.util.find_spec(module) is None]
+    
+    if missing_modules:
+        print("❌ Missing required modules:")
+        for module in missing_modules:
+            print(f"  - {module}")
+        print("\n📦 Install with: pip install pygame numpy pyaudio scipy librosa numba")
+        sys.exit(1)
+
+# Runs before the imports below, which would otherwise fail with a bare ImportError
+_check_dependencies()
+
+import pygame
+import numpy as np
+import pyaudio
+from scipy.fft import rfft
+from scipy.signal import resample_poly
 import librosa
+from numba import njit
 from effects.effects_registry import effects_registry
 from colors.colors_registry import colors_registry
 
+@njit(cache=True)
+def _beat_stats(freqs, bass_n):
+    """Sum the bass bins and the whole spectrum in a single pass"""
+    s_bass = 0.0
+    s_total = 0.0
+    for i in range(freqs.shape[0]):
+        v = freqs[i]
+        s_total += v
+        if i < bass_n:
+            s_bass += v
+    return s_bass, s_total
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_input_devices():
+    """List (index, device_info) for all audio input devices, cached until cleared"""
+    audio = pyaudio.PyAudio()
+    try:
+        devices = []
+        for i in range(audio.get_device_count()):
+            try:
+                device_info = audio.get_device_info_by_index(i)
+                if device_info['maxInputChannels'] > 0:
+                    devices.append((i, device_info))
+            except Exception:
+                continue
+        return tuple(devices)
+    finally:
+        audio.terminate()
+
+@dataclass(frozen=True)
+class AudioSnapshot:
+    """Consistent view of the audio state, published once per audio block"""
+    volume: float
+    beat_detected: bool
+    bpm: float
+    bpm_confidence: float
+    frequencies: np.ndarray
+    last_beat_time: float
+    beat_interval: float
+    
+    def get_beat_progress(self):
+        """Get progress through current beat (0.0 to 1.0)"""
+        time_since_last_beat = time.monotonic() - self.last_beat_time
+        return (time_since_last_beat % self.beat_interval) / self.beat_interval
+    
+    def is_on_beat(self, tolerance=0.1):
+        """Check if we're currently on a beat"""
+        progress = self.get_beat_progress()
+        return progress <= tolerance or progress >= (1.0 - tolerance)
+
 class AudioProcessor:
     """Advanced audio processor with librosa BPM detection"""
     
@@ -30,7 +104,10 @@ class AudioProcessor:
         self.running = False
         self.beat_detected = False
         self.volume = 0.0
-        self.frequencies = np.zeros(chunk_size // 2)
+        # Magnitudes are rewritten in place each block; other threads only see
+        # the copy taken into self.snapshot
+        self.frequencies = np.zeros(chunk_size // 2 + 1, dtype=np.float32)
+        self._spec_mean_ema = None  # Running spectrum mean, tracks the noise floor
         
         # Librosa BPM detection
         self.bpm = 120.0
@@ -39,18 +116,48 @@ class AudioProcessor:
         self.last_beat_time = 0
         self.beat_interval = 0.5  # seconds between beats
         
-        # Audio buffer for librosa analysis
-        self.audio_buffer = []
+        # Audio ring buffer for librosa analysis
         self.buffer_duration = 3.0  # seconds of audio to analyze
         self.buffer_samples = int(self.buffer_duration * self.sample_rate)
+        # Stored twice back to back so the latest window is always one contiguous slice
+        self._ring = np.zeros(2 * self.buffer_samples, dtype=np.float32)
+        self._ring_pos = 0
+        self._ring_filled = 0
+        self._samples_written = 0  # Total samples ever written, to place the ring in time
+        
+        # BPM analysis runs on a worker thread fed with snapshots of the ring
+        self._bpm_queue = queue.Queue(maxsize=1)
+        self._bpm_lock = threading.Lock()
+        self._bpm_thread = None
+        self._bpm_interval = 0.5  # seconds between BPM analyses
+        self._bpm_smoothing = 0.5  # weight of each new tempo estimate
+        self._last_bpm_request = 0.0
+        self._silence_threshold = 0.005  # Peak level below which BPM analysis is skipped
+        
+        # Onset envelope cached by absolute frame so each analysis only computes new frames
+        self._onset_hop = 256  # at the halved sample rate, same frame rate as 512 at full rate
+        self._onset_n_fft = 2048
+        self._resample_margin = 32  # trailing samples affected by the resampling filter edge
+        self._onset_env = None
+        self._onset_first_frame = 0
+        self._onset_next_frame = 0
+        
+        # Replaced (never mutated) after each audio block, so readers on other
+        # threads always see one consistent set of values
+        self.snapshot = self._make_snapshot()
         
         # Audio components
         self.audio = None
         self.stream = None
+        self._capture_thread = None
         self.current_device_name = "Default"
         
     def start_audio(self, device_index=None):
         """Start audio capture"""
+        # Only one capture may read at a time; release the previous stream first
+        if self.running:
+            self.stop_audio()
+        
         try:
             print("Starting audio capture...")
             print(f"Requested device index: {device_index}")
@@ -98,19 +205,21 @@ class AudioProcessor:
                     self.current_device_name = f"Device {device_to_use}"
                     print(f"Could not get device name for index {device_to_use}")
             
-            # Open audio stream
+            # Open audio stream in blocking mode; samples are pulled by a regular
+            # Python thread so no Python code runs on PortAudio's real-time thread
             self.stream = self.audio.open(
                 format=pyaudio.paFloat32,
                 channels=1,
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=device_to_use,
-                frames_per_buffer=self.chunk_size,
-                stream_callback=self._audio_callback
+                frames_per_buffer=self.chunk_size
             )
             
             self.running = True
-            self.stream.start_stream()
+            self._start_bpm_worker()
+            self._capture_thread = threading.Thread(target=self._capture_loop, args=(self.stream,), daemon=True)
+            self._capture_thread.start()
             print(f"✅ Audio started on: {self.current_device_name}")
             return True
             
@@ -118,33 +227,48 @@ class AudioProcessor:
             print(f"Audio start failed: {e}")
             return False
     
-    def _audio_callback(self, in_data, frame_count, time_info, status):
+    def _capture_loop(self, stream):
+        """Read audio chunks from the given stream until capture stops"""
+        while self.running:
+            try:
+                # Blocks inside PortAudio (without the GIL) until a chunk is ready
+                in_data = stream.read(self.chunk_size, exception_on_overflow=False)
+            except Exception as e:
+                if self.running:
+                    print(f"Audio read error: {e}")
+                break
+            self._process_audio(in_data)
+    
+    def _process_audio(self, in_data):
         """Process audio data with librosa BPM detection"""
         try:
             audio_data = np.frombuffer(in_data, dtype=np.float32)
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            # Calculate volume
-            self.volume = np.sqrt(np.mean(audio_data**2))
+            # Calculate volume (RMS via a single dot product, no temporaries)
+            self.volume = math.sqrt(float(np.dot(audio_data, audio_data)) / len(audio_data))
             
-            # FFT for frequency analysis
-            fft_data = np.abs(fft(audio_data))
-            self.frequencies = fft_data[:len(fft_data)//2]
+            # Real FFT for frequency analysis (input is real, so only N/2+1 bins);
+            # float32 input keeps the FFT in complex64 and magnitudes go into a reused buffer
+            np.abs(rfft(audio_data), out=self.frequencies)
             
-            # Add to audio buffer for librosa analysis
-            self.audio_buffer.extend(audio_data)
+            # Add to audio ring buffer for librosa analysis
+            self._write_ring(audio_data)
             
-            # Keep buffer size manageable
-            if len(self.audio_buffer) > self.buffer_samples:
-                self.audio_buffer = self.audio_buffer[-self.buffer_samples:]
-            
-            # Analyze BPM when we have enough data
-            if len(self.audio_buffer) >= self.buffer_samples:
-                self.analyze_bpm_with_librosa()
+            # Hand BPM analysis to the worker when we have enough data
+            if (self._ring_filled >= self.buffer_samples
+                    and current_time - self._last_bpm_request >= self._bpm_interval):
+                self._last_bpm_request = current_time
+                self._enqueue_bpm_job()
             
             # Simple beat detection for immediate response
-            bass_energy = np.sum(self.frequencies[:20])
-            threshold = np.mean(self.frequencies) * 2.0
+            bass_energy, total_energy = _beat_stats(self.frequencies, 20)
+            spec_mean = total_energy / len(self.frequencies)
+            if self._spec_mean_ema is None:
+                self._spec_mean_ema = spec_mean
+            else:
+                self._spec_mean_ema = 0.99 * self._spec_mean_ema + 0.01 * spec_mean
+            threshold = 2.0 * self._spec_mean_ema
             old_beat = self.beat_detected
             self.beat_detected = bass_energy > threshold
             
@@ -152,71 +276,188 @@ class AudioProcessor:
                 self.last_beat_time = current_time
                 print(f"🎵 Beat detected! BPM: {self.bpm:.1f} (confidence: {self.bpm_confidence:.2f})")
             
-            return (None, pyaudio.paContinue)
+            # Publish this block's results with a single attribute store
+            self.snapshot = self._make_snapshot()
             
         except Exception as e:
-            print(f"Audio callback error: {e}")
-            return (None, pyaudio.paContinue)
+            print(f"Audio processing error: {e}")
+    
+    def _make_snapshot(self):
+        """Capture the current audio state as an immutable AudioSnapshot"""
+        with self._bpm_lock:
+            bpm = self.bpm
+            bpm_confidence = self.bpm_confidence
+            beat_interval = self.beat_interval
+        return AudioSnapshot(
+            volume=self.volume,
+            beat_detected=self.beat_detected,
+            bpm=bpm,
+            bpm_confidence=bpm_confidence,
+            # Own copy (~2 KB): the spectrum buffers are rewritten in place a block later
+            frequencies=self.frequencies.copy(),
+            last_beat_time=self.last_beat_time,
+            beat_interval=beat_interval,
+        )
+    
+    def _write_ring(self, samples):
+        """Append samples to the ring buffer, overwriting the oldest audio"""
+        size = self.buffer_samples
+        if len(samples) > size:
+            samples = samples[-size:]
+        count = len(samples)
+        start = self._ring_pos
+        end = start + count
+        
+        # Write both copies so any window of buffer_samples stays contiguous
+        for offset in (0, size):
+            if end <= size:
+                self._ring[offset + start:offset + end] = samples
+            else:
+                split = size - start
+                self._ring[offset + start:offset + size] = samples[:split]
+                self._ring[offset:offset + end - size] = samples[split:]
+        
+        self._ring_pos = end % size
+        self._ring_filled = min(size, self._ring_filled + count)
+        self._samples_written += count
+    
+    def _ring_window(self):
+        """Return the buffered audio as a contiguous view, oldest sample first"""
+        return self._ring[self._ring_pos:self._ring_pos + self.buffer_samples]
+    
+    def _enqueue_bpm_job(self):
+        """Queue a snapshot of the ring for analysis, replacing any unstarted job"""
+        try:
+            self._bpm_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._bpm_queue.put_nowait((self._ring_window().copy(), self._samples_written))
+        except queue.Full:
+            pass
+    
+    def _start_bpm_worker(self):
+        """Start the BPM analysis thread if it isn't already running"""
+        if self._bpm_thread and self._bpm_thread.is_alive():
+            return
+        self._bpm_thread = threading.Thread(target=self._bpm_worker_loop, daemon=True)
+        self._bpm_thread.start()
+    
+    def _bpm_worker_loop(self):
+        """Run librosa analysis on queued audio snapshots until audio stops"""
+        while self.running:
+            try:
+                audio_array, samples_written = self._bpm_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self.analyze_bpm_with_librosa(audio_array, samples_written)
     
-    def analyze_bpm_with_librosa(self):
+    def _update_onset_envelope(self, audio_ds, end_ds):
+        """
+        Return the onset envelope for a downsampled window, reusing cached frames.
+        
+        Args:
+            audio_ds: downsampled audio window
+            end_ds: absolute downsampled sample index just past the window's end
+        """
+        sr = self.sample_rate // 2
+        hop = self._onset_hop
+        n_fft = self._onset_n_fft
+        start_ds = end_ds - len(audio_ds)
+        
+        # Frames lying fully inside the window, clear of the resampling edge
+        first = -(-start_ds // hop)
+        last = (end_ds - self._resample_margin - n_fft) // hop
+        
+        if (self._onset_env is not None and self._onset_first_frame <= first < self._onset_next_frame):
+            # Keep cached frames still in the window; frame compute_from - 1 is the lag reference
+            envelope = self._onset_env[first - self._onset_first_frame:]
+            compute_from = self._onset_next_frame
+            seg_frame = compute_from - 1
+        else:
+            envelope = np.zeros(0, dtype=np.float32)
+            compute_from = first
+            seg_frame = first
+        
+        if compute_from <= last:
+            segment = audio_ds[seg_frame * hop - start_ds:last * hop + n_fft - start_ds]
+            mel = librosa.feature.melspectrogram(y=segment, sr=sr, n_fft=n_fft, hop_length=hop, center=False)
+            # Fixed -80 dB floor (instead of relative to the segment max) keeps
+            # envelope values comparable across separately computed segments
+            mel_db = librosa.power_to_db(mel, amin=1e-8, top_db=None)
+            new_env = librosa.onset.onset_strength(S=mel_db, sr=sr, hop_length=hop, center=False)
+            if seg_frame < compute_from:
+                new_env = new_env[1:]  # Drop the lag reference frame
+            envelope = np.concatenate((envelope, new_env.astype(np.float32)))
+        
+        self._onset_env = envelope
+        self._onset_first_frame = first
+        self._onset_next_frame = last + 1
+        return envelope
+    
+    def analyze_bpm_with_librosa(self, audio_array=None, samples_written=None):
         """Analyze BPM using librosa beat tracking"""
         try:
-            if len(self.audio_buffer) < self.buffer_samples:
+            if audio_array is None:
+                if self._ring_filled < self.buffer_samples:
+                    return
+                
+                # Contiguous view of the buffered audio, oldest sample first
+                audio_array = self._ring_window()
+                samples_written = self._samples_written
+            
+            # Silent input only yields a noise tempo; let confidence decay instead
+            if np.max(np.abs(audio_array[-self.chunk_size:])) < self._silence_threshold:
+                with self._bpm_lock:
+                    self.bpm_confidence *= 0.9
                 return
             
-            # Convert buffer to numpy array
-            audio_array = np.array(self.audio_buffer, dtype=np.float32)
+            # Tempo lives well below 11 kHz, so halve the sample rate before analysis
+            audio_ds = resample_poly(audio_array, up=1, down=2)
             
-            # Use librosa to detect tempo and beats
-            tempo, beats = librosa.beat.beat_track(y=audio_array, sr=self.sample_rate)
+            # Use librosa to detect tempo and beats from the incrementally built envelope
+            onset_env = self._update_onset_envelope(audio_ds, samples_written // 2)
+            tempo, beats = librosa.beat.beat_track(onset_envelope=onset_env, sr=self.sample_rate // 2,
+                                                   hop_length=self._onset_hop)
             
             # Update BPM with smoothing
-            tempo_value = float(tempo.item() if hasattr(tempo, 'item') else tempo)
-            if 60 <= tempo_value <= 200:  # Reasonable BPM range
-                self.bpm = self.bpm * 0.8 + tempo_value * 0.2
-                self.beat_interval = 60.0 / self.bpm
-                
-                # Calculate confidence based on beat consistency
-                if len(beats) > 1:
-                    beat_intervals = np.diff(beats)
-                    interval_std = np.std(beat_intervals)
-                    interval_mean = np.mean(beat_intervals)
+            # beat_track returns a scalar or a 1-element array depending on librosa version
+            tempo_value = float(np.ravel(tempo)[0])
+            with self._bpm_lock:
+                if 60 <= tempo_value <= 200:  # Reasonable BPM range
+                    self.bpm = self.bpm * (1.0 - self._bpm_smoothing) + tempo_value * self._bpm_smoothing
+                    self.beat_interval = 60.0 / self.bpm
                     
-                    # Confidence based on regularity (lower std = higher confidence)
-                    if interval_mean > 0:
-                        regularity = 1.0 - min(1.0, interval_std / interval_mean)
-                        self.bpm_confidence = max(0.0, min(1.0, regularity))
-            else:
-                self.bpm_confidence = 0.0
+                    # Calculate confidence based on beat consistency
+                    if len(beats) > 1:
+                        beat_intervals = np.diff(beats)
+                        interval_std = np.std(beat_intervals)
+                        interval_mean = np.mean(beat_intervals)
+                        
+                        # Confidence based on regularity (lower std = higher confidence)
+                        if interval_mean > 0:
+                            regularity = 1.0 - min(1.0, float(interval_std / interval_mean))
+                            self.bpm_confidence = max(0.0, min(1.0, regularity))
+                else:
+                    self.bpm_confidence = 0.0
         except Exception as e:
             print(f"Librosa BPM analysis error: {e}")
     
-    def get_beat_progress(self):
-        """Get progress through current beat (0.0 to 1.0)"""
-        current_time = time.time()
-        time_since_last_beat = current_time - self.last_beat_time
-        
-        if time_since_last_beat > self.beat_interval:
-            # Reset if we've missed a beat
-            self.last_beat_time = current_time
-            return 0.0
-        
-        return time_since_last_beat / self.beat_interval
-    
-    def is_on_beat(self, tolerance=0.1):
-        """Check if we're currently on a beat"""
-        progress = self.get_beat_progress()
-        return progress <= tolerance or progress >= (1.0 - tolerance)
-    
     def stop_audio(self):
         """Stop audio capture"""
         self.running = False
         
+        # Let the capture thread finish its current read before closing the stream
+        if self._capture_thread and self._capture_thread.is_alive():
+            self._capture_thread.join(timeout=1.0)
+        
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
         if self.audio:
             self.audio.terminate()
+            self.audio = None
 
 # Effects are now imported from the effects package
 
@@ -228,9 +469,11 @@ class ProjectorRenderer:
         self.running = False
         self.color_effect = None
         self.overlay_effect = None
-        self.clock = pygame.time.Clock()
+        self.target_fps = 60  # Frame rate the render loop paces itself to
         self.start_time = time.time()
         self.initialized = False
+        self._drawn_background = None  # Color effect drawn in the last frame
+        self._drawn_overlay = None  # Overlay effect drawn in the last frame
         
     def initialize_projector(self):
         """Initialize pygame and projector window"""
@@ -252,6 +495,11 @@ class ProjectorRenderer:
             self.screen = pygame.display.set_mode(projector_size, pygame.NOFRAME)
             pygame.display.set_caption("Lasjector")
             
+            # The new window is blank, so the first frame must be a full redraw
+            # even if the cached effects from a previous show are reused
+            self._drawn_background = None
+            self._drawn_overlay = None
+            
             self.initialized = True
             
             print(f"✅ Projector initialized: {projector_size}")
@@ -272,17 +520,47 @@ class ProjectorRenderer:
         for event in pygame.event.get():
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED):
+                # Window contents may have been lost; force a full redraw and flip
+                self._drawn_background = None
+        
+        # Read both layers once; the Tk thread may swap them mid-frame
+        color_effect = self.color_effect
+        overlay_effect = self.overlay_effect
+        
+        # With an unchanged static background only the regions the overlay
+        # touches need redrawing; None means redraw the whole frame
+        dirty = None
+        if (color_effect and color_effect.is_static()
+                and color_effect is self._drawn_background
+                and overlay_effect is self._drawn_overlay):
+            if overlay_effect:
+                dirty = overlay_effect.dirty_rects(time_elapsed)
+            else:
+                dirty = []
         
         # Render color layer first (background)
-        if self.color_effect:
-            self.color_effect.render(self.screen, time_elapsed, audio_data)
+        if color_effect:
+            if dirty is None:
+                color_effect.render(self.screen, time_elapsed, audio_data)
+            else:
+                for rect in dirty:
+                    self.screen.set_clip(rect)
+                    color_effect.render(self.screen, time_elapsed, audio_data)
+                self.screen.set_clip(None)
         
         # Render overlay effect on top
-        if self.overlay_effect:
-            self.overlay_effect.render(self.screen, time_elapsed, audio_data)
+        if overlay_effect:
+            overlay_effect.render(self.screen, time_elapsed, audio_data)
         
-        pygame.display.flip()
-        self.clock.tick(60)
+        self._drawn_background = color_effect
+        self._drawn_overlay = overlay_effect
+        
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
     
     def cleanup(self):
         """Clean up"""
@@ -301,16 +579,30 @@ class ControlDashboard:
         self.renderer = ProjectorRenderer()
         self.audio_processor = AudioProcessor()
         
+        # Width of each of the 8 frequency bands, fixed by the FFT size
+        self._band_size = len(self.audio_processor.frequencies) // 8
+        
         self.running = False
         self.render_thread = None
+        self._stop_event = threading.Event()  # Set to wake and end the render loop
         self.audio_devices = []  # Store available audio devices
+        self._device_index_by_display = {}  # Dropdown label -> device index
         self.preview_running = False
-        self.preview_thread = None
+        self._preview_after_id = None
+        self._preview_interval_ms = 33  # ~30 UI updates per second
+        self._preview_next_t = 0.0  # Monotonic deadline of the next preview tick
+        self._preview_shown = {}  # Last value pushed to each preview widget
+        self._log = collections.deque(maxlen=200)  # Most recent status lines
+        self._log_queue = queue.Queue()  # Lines waiting for the Tk thread, from any thread
         self.config_file = "lasjector_config.json"
         self.default_device = None
+        self._default_device_index = None  # Resolved when the device list is built
         
         self.setup_ui()
         
+        # Status lines are drawn only from the Tk thread
+        self.root.after(100, self._drain_log)
+        
     def setup_ui(self):
         """Create the control dashboard UI"""
         # Main frame
@@ -335,6 +627,9 @@ class ControlDashboard:
         self.audio_enabled = tk.BooleanVar(value=True)
         ttk.Checkbutton(main_frame, text="🎵 Audio Sync", 
                        variable=self.audio_enabled).grid(row=1, column=2)
+        # Plain copy for the render thread, which must not read Tcl variables
+        self._audio_sync = self.audio_enabled.get()
+        self.audio_enabled.trace_add("write", self._on_audio_enabled_changed)
         
         # Audio device selection
         ttk.Label(main_frame, text="Audio Device:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky=tk.W, pady=(20, 5))
@@ -355,7 +650,10 @@ class ControlDashboard:
                   command=self.set_default_device).grid(row=0, column=1, padx=(0, 5))
         
         ttk.Button(audio_controls_frame, text="🗑️ Clear Default", 
-                  command=self.clear_default_device).grid(row=0, column=2)
+                  command=self.clear_default_device).grid(row=0, column=2, padx=(0, 5))
+        
+        ttk.Button(audio_controls_frame, text="🔍 Refresh Devices", 
+                  command=self.refresh_audio_devices).grid(row=0, column=3)
         
         # Audio preview section
         ttk.Label(main_frame, text="Audio Preview:", font=("Arial", 10, "bold")).grid(row=4, column=0, sticky=tk.W, pady=(20, 5))
@@ -471,48 +769,48 @@ class ControlDashboard:
         self.load_default_device()
         self.populate_audio_devices()
         
-    def populate_audio_devices(self):
-        """Populate the audio device dropdown"""
+    def populate_audio_devices(self, keep_selection=False):
+        """Populate the audio device dropdown, optionally keeping a still-present selection"""
         try:
-            import pyaudio
-            audio = pyaudio.PyAudio()
-            
+            previous_selection = self.audio_device_var.get() if keep_selection else None
             devices = ["Auto - Let app choose best option"]
             device_info_list = [{"name": "Auto", "index": -1}]
+            device_index_by_display = {}
             
-            # Get all input devices
-            for i in range(audio.get_device_count()):
-                try:
-                    device_info = audio.get_device_info_by_index(i)
-                    if device_info['maxInputChannels'] > 0:
-                        device_name = device_info['name']
-                        devices.append(f"🎤 {device_name}")
-                        device_info_list.append({
-                            "name": device_name,
-                            "index": i,
-                            "info": device_info
-                        })
-                except Exception as e:
-                    continue
+            # Get all input devices (enumerated once, until refreshed)
+            for i, device_info in _enumerate_input_devices():
+                device_name = device_info['name']
+                display_name = f"🎤 {device_name}"
+                devices.append(display_name)
+                # First device wins if two share a name, matching the dropdown order
+                device_index_by_display.setdefault(display_name, i)
+                device_info_list.append({
+                    "name": device_name,
+                    "index": i,
+                    "info": device_info
+                })
             
             # Store device info for later use
             self.audio_devices = device_info_list
+            self._device_index_by_display = device_index_by_display
             
             # Update combobox
             self.audio_device_combo['values'] = devices
             
-            # Set default device if available
+            # Resolve the default device's index once here
+            self._default_device_index = None
             if self.default_device:
-                # Find the default device in the list
-                default_found = False
-                for device in self.audio_devices:
-                    if device['name'] == self.default_device:
-                        self.audio_device_var.set(f"🎤 {device['name']}")
-                        default_found = True
-                        self.log_status(f"✅ Set to default device: {device['name']}")
-                        break
-                
-                if not default_found:
+                self._default_device_index = device_index_by_display.get(f"🎤 {self.default_device}")
+            
+            # Keep the user's choice if it survived a rescan, else fall back to default/Auto
+            if previous_selection in device_index_by_display or previous_selection == "Auto - Let app choose best option":
+                self.audio_device_var.set(previous_selection)
+            elif self.default_device:
+                default_display = f"🎤 {self.default_device}"
+                if self._default_device_index is not None:
+                    self.audio_device_var.set(default_display)
+                    self.log_status(f"✅ Set to default device: {self.default_device}")
+                else:
                     self.log_status(f"⚠️ Default device '{self.default_device}' not found, using Auto")
                     self.audio_device_var.set("Auto - Let app choose best option")
             else:
@@ -522,13 +820,16 @@ class ControlDashboard:
                 self.log_status(f"Found {len(devices)-1} audio input devices")
             else:
                 self.log_status("No audio input devices found")
-                
-            audio.terminate()
             
         except Exception as e:
             self.log_status(f"Error loading audio devices: {e}")
             self.audio_device_combo['values'] = ["Auto - Let app choose best option"]
     
+    def refresh_audio_devices(self):
+        """Re-scan audio input devices and repopulate the dropdown"""
+        _enumerate_input_devices.cache_clear()
+        self.populate_audio_devices(keep_selection=True)
+    
     def restart_audio(self):
         """Restart audio capture"""
         if self.running:
@@ -545,16 +846,14 @@ class ControlDashboard:
             
             # Find the selected device index
             if selected_device != "Auto - Let app choose best option":
-                for device in self.audio_devices:
-                    if device['name'] in selected_device:
-                        device_index = device['index']
-                        self.log_status(f"Found device: {device['name']} (index: {device_index})")
-                        break
-                if device_index is None:
+                device_index = self._device_index_by_display.get(selected_device)
+                if device_index is not None:
+                    self.log_status(f"Found device: {selected_device} (index: {device_index})")
+                else:
                     self.log_status(f"⚠️ Could not find device index for: {selected_device}")
             else:
                 # Use default device if available
-                device_index = self.get_default_device_index()
+                device_index = self._default_device_index
                 if device_index is not None:
                     self.log_status(f"Using default device index: {device_index}")
                 else:
@@ -606,28 +905,20 @@ class ControlDashboard:
         device_name = selected_device.replace("🎤 ", "").replace("🎵 ", "")
         
         self.default_device = device_name
+        self._default_device_index = self._device_index_by_display.get(selected_device)
         self.save_default_device()
         self.log_status(f"✅ Set default device: {device_name}")
     
     def clear_default_device(self):
         """Clear the default device setting"""
         self.default_device = None
+        self._default_device_index = None
         self.save_default_device()
         self.log_status("🗑️ Cleared default device")
         
         # Reset dropdown to Auto
         self.audio_device_var.set("Auto - Let app choose best option")
     
-    def get_default_device_index(self):
-        """Get the device index for the default device"""
-        if not self.default_device:
-            return None
-            
-        for device in self.audio_devices:
-            if device['name'] == self.default_device:
-                return device['index']
-        return None
-    
     def select_effect(self, effect_name):
         """Select an effect and update the UI"""
         self.current_effect = effect_name
@@ -689,13 +980,10 @@ class ControlDashboard:
         
         # Find the selected device index
         if selected_device != "Auto - Let app choose best option":
-            for device in self.audio_devices:
-                if device['name'] in selected_device:
-                    device_index = device['index']
-                    break
+            device_index = self._device_index_by_display.get(selected_device)
         else:
             # Use default device if available
-            device_index = self.get_default_device_index()
+            device_index = self._default_device_index
         
         # Start audio capture for preview
         if self.audio_processor.start_audio(device_index):
@@ -703,9 +991,9 @@ class ControlDashboard:
             self.preview_button.config(text="⏹️ Stop Preview")
             self.log_status(f"🎵 Audio preview started: {self.audio_processor.current_device_name}")
             
-            # Start preview update thread
-            self.preview_thread = threading.Thread(target=self.preview_update_loop, daemon=True)
-            self.preview_thread.start()
+            # Start preview updates on the Tk main loop
+            self._preview_next_t = time.monotonic()
+            self._preview_tick()
         else:
             self.log_status("❌ Failed to start audio preview")
     
@@ -715,6 +1003,9 @@ class ControlDashboard:
             return
             
         self.preview_running = False
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
         self.audio_processor.stop_audio()
         self.preview_button.config(text="🎵 Start Preview")
         
@@ -726,65 +1017,106 @@ class ControlDashboard:
         self.confidence_label.config(text="0.00")
         for bar in self.freq_bars:
             bar['value'] = 0
+        self._preview_shown.clear()
         
         self.log_status("🛑 Audio preview stopped")
     
-    def preview_update_loop(self):
-        """Update audio preview UI elements"""
-        while self.preview_running:
-            try:
-                # Update volume meter
-                volume = self.audio_processor.volume
-                volume_percent = min(100, volume * 1000)  # Scale for display
-                
-                # Update UI (must be done in main thread)
-                self.root.after(0, self.update_preview_ui, volume, volume_percent)
-                
-                time.sleep(0.05)  # Update 20 times per second
-            except Exception as e:
-                print(f"Preview update error: {e}")
-                break
-    
-    def update_preview_ui(self, volume, volume_percent):
-        """Update preview UI elements (called from main thread)"""
+    def _preview_tick(self):
+        """Update audio preview UI elements on the Tk main loop, then reschedule"""
+        self._preview_after_id = None
+        if not self.preview_running:
+            return
+        
+        # The snapshot is replaced, never mutated, so reading it needs no lock
         try:
-            # Update volume meter
-            self.volume_meter['value'] = volume_percent
-            self.volume_label.config(text=f"{volume:.3f}")
-            
-            # Update beat indicator
-            if self.audio_processor.beat_detected:
-                self.beat_indicator.config(text="●", foreground="red")
-            else:
-                self.beat_indicator.config(text="●", foreground="gray")
-            
-            # Update BPM display
-            bpm_value = float(self.audio_processor.bpm.item() if hasattr(self.audio_processor.bpm, 'item') else self.audio_processor.bpm)
-            confidence_value = float(self.audio_processor.bpm_confidence.item() if hasattr(self.audio_processor.bpm_confidence, 'item') else self.audio_processor.bpm_confidence)
-            self.bpm_label.config(text=f"{bpm_value:.1f}")
-            self.confidence_label.config(text=f"{confidence_value:.2f}")
-            
-            # Update frequency bars
-            frequencies = self.audio_processor.frequencies
-            if len(frequencies) > 0:
-                # Divide frequencies into 8 bands
-                band_size = len(frequencies) // 8
-                for i in range(8):
-                    start_idx = i * band_size
-                    end_idx = start_idx + band_size
-                    band_energy = np.mean(frequencies[start_idx:end_idx]) if end_idx <= len(frequencies) else 0
-                    bar_value = min(100, band_energy * 100)  # Scale for display
-                    self.freq_bars[i]['value'] = bar_value
-                    
+            self.update_preview_ui(self.audio_processor.snapshot)
         except Exception as e:
-            print(f"UI update error: {e}")
+            # Stop instead of failing again on every tick
+            self.log_status(f"❌ Preview error: {e}")
+            self.stop_audio_preview()
+            return
+        
+        # Schedule against a fixed deadline so time spent here doesn't add up as drift
+        now = time.monotonic()
+        self._preview_next_t += self._preview_interval_ms / 1000.0
+        if self._preview_next_t < now:
+            # Fell behind; skip the missed ticks rather than queueing them back to back
+            self._preview_next_t = now + self._preview_interval_ms / 1000.0
+        delay_ms = max(1, int((self._preview_next_t - now) * 1000))
+        self._preview_after_id = self.root.after(delay_ms, self._preview_tick)
+    
+    def update_preview_ui(self, audio):
+        """Update preview UI elements from an AudioSnapshot (must run on the Tk main thread)"""
+        # Every widget update is a Tk round-trip, so only push values that changed
+        # Read each audio attribute once
+        volume = audio.volume
+        beat_detected = audio.beat_detected
+        bpm = audio.bpm
+        bpm_confidence = audio.bpm_confidence
+        frequencies = audio.frequencies
+        
+        # Update volume meter
+        meter_value = int(min(100, volume * 1000))  # Scale for display
+        if self._preview_changed('volume_meter', meter_value):
+            self.volume_meter['value'] = meter_value
+        volume_text = f"{volume:.3f}"
+        if self._preview_changed('volume_label', volume_text):
+            self.volume_label.config(text=volume_text)
+        
+        # Update beat indicator
+        beat_color = "red" if beat_detected else "gray"
+        if self._preview_changed('beat_indicator', beat_color):
+            self.beat_indicator.config(text="●", foreground=beat_color)
+        
+        # Update BPM display (the audio processor stores plain floats)
+        bpm_text = f"{bpm:.1f}"
+        if self._preview_changed('bpm_label', bpm_text):
+            self.bpm_label.config(text=bpm_text)
+        confidence_text = f"{bpm_confidence:.2f}"
+        if self._preview_changed('confidence_label', confidence_text):
+            self.confidence_label.config(text=confidence_text)
+        
+        # Update frequency bars
+        if len(frequencies) >= 8 * self._band_size:
+            # Average all 8 bands in one vectorized pass, quantized to whole percents
+            band_energy = frequencies[:8 * self._band_size].reshape(8, self._band_size).mean(axis=1)
+            bar_values = np.minimum(band_energy * 100, 100).astype(np.uint8)  # Scale for display
+            for i, bar_value in enumerate(bar_values.tolist()):
+                if self._preview_changed(i, bar_value):
+                    self.freq_bars[i]['value'] = bar_value
+    
+    def _preview_changed(self, key, value):
+        """Remember value as shown for a preview widget; True if it differs from before"""
+        if self._preview_shown.get(key) == value:
+            return False
+        self._preview_shown[key] = value
+        return True
+    
+    def _on_audio_enabled_changed(self, *args):
+        """Mirror the Audio Sync checkbox into a plain bool for the render thread"""
+        self._audio_sync = self.audio_enabled.get()
     
     def log_status(self, message):
-        """Add message to status display"""
+        """Add message to status display (safe to call from any thread)"""
         timestamp = time.strftime("%H:%M:%S")
-        self.status_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
+        self._log_queue.put(f"[{timestamp}] {message}")
+    
+    def _drain_log(self):
+        """Move queued status lines into the display, at most every 100ms"""
+        updated = False
+        while True:
+            try:
+                self._log.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+            updated = True
+        
+        if updated:
+            self.status_text.delete("1.0", tk.END)
+            self.status_text.insert(tk.END, "\n".join(self._log) + "\n")
+            self.status_text.see(tk.END)
+        
+        self.root.after(100, self._drain_log)
     
     def start_system(self):
         """Start the laser show"""
@@ -812,13 +1144,10 @@ class ControlDashboard:
             
             # Find the selected device index
             if selected_device != "Auto - Let app choose best option":
-                for device in self.audio_devices:
-                    if device['name'] in selected_device:
-                        device_index = device['index']
-                        break
+                device_index = self._device_index_by_display.get(selected_device)
             else:
                 # Use default device if available
-                device_index = self.get_default_device_index()
+                device_index = self._default_device_index
             
             if self.audio_processor.start_audio(device_index):
                 self.log_status(f"✅ Audio started: {self.audio_processor.current_device_name}")
@@ -828,6 +1157,7 @@ class ControlDashboard:
         # Start render thread
         self.running = True
         self.renderer.running = True
+        self._stop_event.clear()
         self.render_thread = threading.Thread(target=self.render_loop, daemon=True)
         self.render_thread.start()
         
@@ -840,14 +1170,27 @@ class ControlDashboard:
     
     def render_loop(self):
         """Main rendering loop"""
+        frame_interval = 1.0 / self.renderer.target_fps
+        next_frame = time.monotonic()
+        
         while self.running and self.renderer.running:
             try:
-                audio_data = self.audio_processor if self.audio_enabled.get() else None
+                # Effects read one snapshot per frame, never the live processor
+                audio_data = self.audio_processor.snapshot if self._audio_sync else None
                 self.renderer.render_frame(audio_data)
-                time.sleep(0.001)
             except Exception as e:
                 self.log_status(f"❌ Render error: {e}")
                 break
+            
+            # Wait for the next frame deadline; stop_system wakes this immediately
+            next_frame += frame_interval
+            delay = next_frame - time.monotonic()
+            if delay < 0:
+                # Running behind; start a fresh schedule rather than bursting frames
+                next_frame = time.monotonic()
+                delay = 0
+            if self._stop_event.wait(delay):
+                break
                 
         self.log_status("🛑 Rendering stopped")
     
@@ -857,7 +1200,9 @@ class ControlDashboard:
         
         self.running = False
         self.renderer.running = False
+        self._stop_event.set()
         
+        # The event wakes the loop at once; the timeout only guards a hung frame
         if self.render_thread and self.render_thread.is_alive():
             self.render_thread.join(timeout=2)
             
@@ -892,23 +1237,7 @@ class ControlDashboard:
 def main():
     """Main entry point"""
     try:
-        # Check dependencies
-        required_modules = ['pygame', 'numpy', 'pyaudio', 'scipy', 'librosa', 'matplotlib']
-        missing_modules = []
-        
-        for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
-                missing_modules.append(module)
-                
-        if missing_modules:
-            print("❌ Missing required modules:")
-            for module in missing_modules:
-                print(f"  - {module}")
-            print("\n📦 Install with: pip install pygame numpy pyaudio scipy librosa matplotlib")
-            return
-            
+        # Dependencies were checked by _check_dependencies() at import time
         # Start application
         app = ControlDashboard()
         app.run()